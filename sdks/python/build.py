@@ -0,0 +1,52 @@
+"""
+Optional build step: compile the model definitions with Cython.
+
+Poetry calls ``build`` from its generated setup.py when building a wheel.
+The compiled extension is built under ``build/`` and added to the wheel next
+to ``models.py``, where it takes precedence on import; nothing is written to
+the source tree. If there is no C compiler, or compilation fails, the wheel
+is built from the pure-Python sources unchanged.
+"""
+
+from typing import Any, Dict
+
+from setuptools.command.build_ext import build_ext
+
+# Modules compiled to extensions; their .py sources stay importable as a fallback
+CYTHON_MODULES = ["schema_registry/models.py"]
+
+
+class OptionalBuildExt(build_ext):
+    """build_ext that falls back to the pure-Python package when compilation fails."""
+
+    def run(self) -> None:
+        try:
+            super().run()
+        except Exception as e:
+            print(f"Cython build failed ({e}); building pure-Python package")
+
+    def build_extension(self, ext: Any) -> None:
+        try:
+            super().build_extension(ext)
+        except Exception as e:
+            print(f"Cython build of {ext.name} failed ({e}); shipping the .py module")
+
+
+def build(setup_kwargs: Dict[str, Any]) -> None:
+    """Add the compiled CYTHON_MODULES to the generated setup.py's arguments."""
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        CYTHON_MODULES,
+        # Keep the generated C sources out of the package directory
+        build_dir="build/cython",
+        language_level=3,
+        compiler_directives={
+            "boundscheck": False,
+            "wraparound": False,
+            # Pydantic inspects validators and annotations like regular Python functions
+            "binding": True,
+            "annotation_typing": False,
+        },
+    )
+    setup_kwargs.update(ext_modules=ext_modules, cmdclass={"build_ext": OptionalBuildExt})
@@ -67,9 +67,7 @@ async def register_and_validate_example():
             "tokens": {"prompt": 10, "completion": 50, "total": 60},
         }
 
-        validation_result = await client.validate_data(
-            schema_id=result.schema_id, data=valid_data
-        )
+        validation_result = await client.validate_data(schema_id=result.schema_id, data=valid_data)
         print(f"\n✓ Valid data validation: {validation_result.is_valid}")
 
         # Validate invalid data (missing required field)
@@ -131,7 +129,11 @@ async def compatibility_check_example():
 
         # NOT BACKWARD compatible (remove required field)
         new_schema_incompatible = json.dumps(
-            {"type": "object", "required": ["user_id"], "properties": {"user_id": {"type": "string"}}}
+            {
+                "type": "object",
+                "required": ["user_id"],
+                "properties": {"user_id": {"type": "string"}},
+            }
         )
 
         compat = await client.check_compatibility(
@@ -145,20 +147,33 @@ async def compatibility_check_example():
 
 
 async def version_management_example():
-    """Example: Manage schema versions."""
+    """
+    Example: Manage schema versions.
+
+    Independent requests can be issued concurrently with asyncio.gather; the
+    client's connection pool (multiplexed over HTTP/2 where available) carries
+    them in parallel instead of paying one round trip after another.
+    """
     async with SchemaRegistryClient(
         base_url="http://localhost:8080", api_key="your-api-key"
     ) as client:
-        # Register multiple versions
-        for i in range(1, 4):
-            schema = Schema(
-                namespace="telemetry",
-                name="ApiEvent",
-                version=f"{i}.0.0",
-                format=SchemaFormat.JSON_SCHEMA,
-                content=json.dumps({"type": "object", "version": i}),
-            )
-            result = await client.register_schema(schema)
+        # Register multiple versions concurrently
+        version_numbers = range(1, 4)
+        results = await asyncio.gather(
+            *[
+                client.register_schema(
+                    Schema(
+                        namespace="telemetry",
+                        name="ApiEvent",
+                        version=f"{i}.0.0",
+                        format=SchemaFormat.JSON_SCHEMA,
+                        content=json.dumps({"type": "object", "version": i}),
+                    )
+                )
+                for i in version_numbers
+            ]
+        )
+        for i, result in zip(version_numbers, results):
             print(f"✓ Registered v{i}.0.0: {result.schema_id}")
 
         # List all versions
@@ -32,7 +32,8 @@ __version__ = "0.1.0"
 __author__ = "Schema Registry Team"
 __license__ = "Apache-2.0"
 
-from .client import SchemaRegistryClient
+from typing import TYPE_CHECKING, Any
+
 from .models import (
     Schema,
     SchemaFormat,
@@ -42,6 +43,14 @@ from .models import (
     CompatibilityMode,
     CompatibilityResult,
 )
+from ._fast_models import (
+    GetSchemaResponseStruct,
+    SchemaMetadataStruct,
+    SchemaStruct,
+    SchemaVersionStruct,
+    SearchResultStruct,
+)
+from ._columnar import SearchResultBatch
 from .exceptions import (
     SchemaRegistryError,
     SchemaNotFoundError,
@@ -51,6 +60,20 @@ from .exceptions import (
     RateLimitError,
 )
 
+if TYPE_CHECKING:
+    from .client import SchemaRegistryClient
+
+
+def __getattr__(name: str) -> Any:
+    # The client (and httpx, tenacity, cachetools with it) is imported on first
+    # use, so code that only needs the models does not pay for it.
+    if name == "SchemaRegistryClient":
+        from .client import SchemaRegistryClient
+
+        return SchemaRegistryClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Client
     "SchemaRegistryClient",
@@ -62,6 +85,13 @@ __all__ = [
     "ValidateResponse",
     "CompatibilityMode",
     "CompatibilityResult",
+    # Wire types
+    "GetSchemaResponseStruct",
+    "SchemaStruct",
+    "SchemaMetadataStruct",
+    "SchemaVersionStruct",
+    "SearchResultStruct",
+    "SearchResultBatch",
     # Exceptions
     "SchemaRegistryError",
     "SchemaNotFoundError",
@@ -0,0 +1,94 @@
+"""
+Request coalescing for the LLM Schema Registry Python SDK.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from .models import ValidateResponse
+
+ValidateItem = Tuple[str, str]
+BatchResult = Union[ValidateResponse, BaseException]
+ProcessBatch = Callable[[List[ValidateItem]], Awaitable[Sequence[BatchResult]]]
+
+
+class _ValidateBatcher:
+    """
+    Coalesce validate calls that arrive within a short window into one RPC.
+
+    Submissions are queued until either ``max_batch_size`` distinct items are
+    pending or ``max_queue_time`` seconds have passed since the first one, and
+    are then handed to ``process_batch`` in a single call, which returns one
+    result (or exception) per item in order. Identical ``(schema_id, data)``
+    submissions within a window share one result.
+    """
+
+    def __init__(
+        self,
+        process_batch: ProcessBatch,
+        max_batch_size: int = 64,
+        max_queue_time: float = 0.005,
+    ):
+        self._process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+
+        self._pending: Dict[ValidateItem, "asyncio.Future[ValidateResponse]"] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def submit(self, schema_id: str, data: str) -> ValidateResponse:
+        """Queue one item and wait for its slice of the batch result."""
+        key = (schema_id, data)
+        future = self._pending.get(key)
+
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.max_queue_time, self._flush)
+
+        # Shield so one cancelled caller does not cancel a result shared with others
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        """Dispatch everything pending as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: Dict[ValidateItem, "asyncio.Future[ValidateResponse]"]) -> None:
+        """Process a batch and resolve each caller's future."""
+        try:
+            results = await self._process_batch(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, result in zip(batch.values(), results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def aclose(self) -> None:
+        """Flush pending items and wait for in-flight batches to finish."""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -0,0 +1,127 @@
+"""
+Column-oriented views over SDK responses for the LLM Schema Registry Python SDK.
+
+Requires numpy (install the ``columnar`` extra).
+"""
+
+from typing import TYPE_CHECKING, Any, Iterable, Sequence, Union, overload
+
+from ._fast_models import SearchResultStruct
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+# Column layout of a SearchResultBatch; scores stay float64 so rows round-trip exactly
+_SEARCH_RESULT_FIELDS = [
+    ("score", "f8"),
+    ("schema_id", "O"),
+    ("namespace", "O"),
+    ("name", "O"),
+    ("version", "O"),
+    ("description", "O"),
+    ("tags", "O"),
+]
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "SearchResultBatch requires numpy; install llm-schema-registry-sdk[columnar]"
+        ) from e
+    return numpy
+
+
+class SearchResultBatch(Sequence[SearchResultStruct]):
+    """
+    Search results stored as parallel columns in a numpy structured array.
+
+    Sorting, filtering and top-k selection on ``scores`` run vectorized
+    instead of iterating result objects; individual results are only built
+    when indexed.
+
+    Example:
+        >>> results = await client.search_schemas("inference", limit=5000)
+        >>> batch = SearchResultBatch.from_records(results)
+        >>> best = batch.top_k(10)
+        >>> best[0].schema_id
+    """
+
+    __slots__ = ("_columns",)
+
+    def __init__(self, columns: "NDArray[Any]"):
+        self._columns = columns
+
+    @classmethod
+    def from_records(cls, records: Iterable[SearchResultStruct]) -> "SearchResultBatch":
+        """Build a batch from search results (structs or SearchResult models)."""
+        np = _import_numpy()
+
+        records = list(records)
+        columns = np.empty(len(records), dtype=_SEARCH_RESULT_FIELDS)
+        for field, _ in _SEARCH_RESULT_FIELDS:
+            values = columns[field]
+            for i, record in enumerate(records):
+                values[i] = getattr(record, field)
+        return cls(columns)
+
+    @property
+    def columns(self) -> "NDArray[Any]":
+        """The underlying structured array, one field per result attribute."""
+        return self._columns
+
+    @property
+    def scores(self) -> "NDArray[Any]":
+        """Relevance scores, as a float64 array."""
+        return self._columns["score"]
+
+    @property
+    def schema_ids(self) -> "NDArray[Any]":
+        """Schema IDs, as an object array."""
+        return self._columns["schema_id"]
+
+    def top_k(self, k: int) -> "SearchResultBatch":
+        """The ``k`` highest-scoring results, best first."""
+        np = _import_numpy()
+
+        scores = self.scores
+        k = min(k, len(scores))
+        if k <= 0:
+            return type(self)(self._columns[:0])
+
+        # Partial partition is O(n); only the k survivors get fully sorted
+        top = np.argpartition(scores, len(scores) - k)[-k:]
+        top = top[np.argsort(scores[top])[::-1]]
+        return type(self)(self._columns[top])
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    @overload
+    def __getitem__(self, index: int) -> SearchResultStruct:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "SearchResultBatch":
+        ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[SearchResultStruct, "SearchResultBatch"]:
+        if isinstance(index, slice):
+            return type(self)(self._columns[index])
+
+        row = self._columns[index]
+        return SearchResultStruct(
+            schema_id=row["schema_id"],
+            namespace=row["namespace"],
+            name=row["name"],
+            version=row["version"],
+            score=float(row["score"]),
+            description=row["description"],
+            tags=row["tags"],
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} results)"
@@ -0,0 +1,144 @@
+"""
+msgspec wire types for the hot paths of the Python SDK.
+
+Schema, search and version-listing responses are decoded straight from the
+response bytes into these structs, skipping the intermediate dicts and the
+Pydantic validation of the equivalent models in :mod:`.models`. Schemas
+being registered are encoded to bytes in a single pass.
+
+Response structs are immutable and never part of reference cycles, so they
+are created with ``gc=False`` and skip cyclic garbage collector tracking.
+The exception is :class:`SchemaMetadataStruct`, which needs an instance
+``__dict__`` to cache its lazily decoded ``custom`` field.
+"""
+
+from datetime import datetime
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import msgspec
+from msgspec.structs import force_setattr
+
+from .models import Schema, SchemaFormat, _intern_tags
+
+
+# Shared default for metadata without custom fields
+_EMPTY_CUSTOM = msgspec.Raw(b"{}")
+
+
+class SchemaMetadataStruct(msgspec.Struct, frozen=True, omit_defaults=True, dict=True):
+    """
+    Metadata for a schema.
+
+    The user-defined ``custom`` object is kept as raw JSON and only decoded
+    when ``custom`` is read; otherwise it is written back out as-is. The raw
+    JSON is copied out of the response on decode, so a cached struct does not
+    keep the whole response body alive.
+    """
+
+    description: Optional[str] = None
+    tags: Tuple[str, ...] = ()
+    owner: Optional[str] = None
+    raw_custom: msgspec.Raw = msgspec.field(default=_EMPTY_CUSTOM, name="custom")
+
+    def __post_init__(self) -> None:
+        if self.tags:
+            force_setattr(self, "tags", _intern_tags(self.tags))
+        # A decoded Raw is a view into the response body; keep only its own bytes
+        force_setattr(self, "raw_custom", self.raw_custom.copy())
+
+    @cached_property
+    def custom(self) -> Dict[str, Any]:
+        """Custom metadata fields."""
+        return _CUSTOM_DECODER.decode(self.raw_custom)
+
+
+class SchemaStruct(msgspec.Struct, frozen=True, omit_defaults=True):
+    """Schema definition, as sent to the registry."""
+
+    namespace: str
+    name: str
+    version: str
+    format: SchemaFormat
+    content: str
+    metadata: Optional[SchemaMetadataStruct] = None
+
+    @classmethod
+    def from_model(cls, schema: Union[Schema, "SchemaStruct"]) -> "SchemaStruct":
+        """Build the wire struct from a validated Schema (no-op for structs)."""
+        if isinstance(schema, SchemaStruct):
+            return schema
+
+        metadata = schema.metadata
+        return cls(
+            namespace=schema.namespace,
+            name=schema.name,
+            version=schema.version,
+            format=schema.format,
+            content=schema.content,
+            metadata=(
+                None
+                if metadata is None
+                else SchemaMetadataStruct(
+                    description=metadata.description,
+                    tags=metadata.tags,
+                    owner=metadata.owner,
+                    raw_custom=(
+                        msgspec.Raw(SCHEMA_ENCODER.encode(metadata.custom))
+                        if metadata.custom
+                        else _EMPTY_CUSTOM
+                    ),
+                )
+            ),
+        )
+
+
+class GetSchemaResponseStruct(msgspec.Struct, frozen=True, gc=False):
+    """
+    Response from schema retrieval.
+
+    Instances with ``metadata`` are not hashable, because the raw ``custom``
+    JSON they carry is not.
+    """
+
+    schema_id: str
+    namespace: str
+    name: str
+    version: str
+    format: SchemaFormat
+    content: str
+    created_at: datetime
+    updated_at: datetime
+    metadata: Optional[SchemaMetadataStruct] = None
+
+
+class SearchResultStruct(msgspec.Struct, frozen=True, gc=False):
+    """Schema search result."""
+
+    schema_id: str
+    namespace: str
+    name: str
+    version: str
+    score: float
+    description: Optional[str] = None
+    tags: Tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        if self.tags:
+            force_setattr(self, "tags", _intern_tags(self.tags))
+
+
+class SchemaVersionStruct(msgspec.Struct, frozen=True, gc=False):
+    """Schema version information."""
+
+    version: str
+    schema_id: str
+    created_at: datetime
+
+
+_CUSTOM_DECODER = msgspec.json.Decoder(Dict[str, Any])
+
+SCHEMA_ENCODER = msgspec.json.Encoder()
+GET_SCHEMA_DECODER = msgspec.json.Decoder(GetSchemaResponseStruct)
+SEARCH_RESULTS_DECODER = msgspec.json.Decoder(List[SearchResultStruct])
+SCHEMA_VERSIONS_DECODER = msgspec.json.Decoder(List[SchemaVersionStruct])
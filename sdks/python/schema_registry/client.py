@@ -2,19 +2,42 @@
 Main client implementation for the LLM Schema Registry Python SDK.
 """
 
+import asyncio
+import gzip
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 from uuid import UUID
 
 import httpx
-from cachetools import TTLCache
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
+import orjson
+
+from ._batching import _ValidateBatcher
+from ._fast_models import (
+    GET_SCHEMA_DECODER,
+    SCHEMA_ENCODER,
+    SCHEMA_VERSIONS_DECODER,
+    SEARCH_RESULTS_DECODER,
+    GetSchemaResponseStruct,
+    SchemaStruct,
+    SchemaVersionStruct,
+    SearchResultStruct,
 )
-
 from .exceptions import (
     AuthenticationError,
     AuthorizationError,
@@ -28,16 +51,105 @@ from .exceptions import (
 from .models import (
     CompatibilityMode,
     CompatibilityResult,
-    GetSchemaResponse,
     RegisterSchemaResponse,
     Schema,
-    SchemaVersion,
-    SearchResult,
+    SchemaFormat,
     ValidateResponse,
+    _check_semver,
 )
 
+if TYPE_CHECKING:
+    from cachetools import LRUCache, TLRUCache, TTLCache
+    from tenacity import AsyncRetrying
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Registry traffic is many small requests to one host: keep plenty of
+# connections warm so concurrent calls rarely pay for a new handshake.
+_DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=100, max_connections=200, keepalive_expiry=60
+)
+
+
+def _rate_limit_error(
+    message: str, error_data: Dict[str, Any], response: httpx.Response
+) -> RateLimitError:
+    retry_after = response.headers.get("Retry-After")
+    return RateLimitError(retry_after=int(retry_after) if retry_after else None)
+
+
+# Request bodies above this size are gzip-compressed when compression is enabled
+_GZIP_MIN_SIZE = 1024
+
+# Encoding or decoding payloads larger than this runs in a worker thread so a
+# single large schema or result set does not stall other coroutines
+_OFFLOAD_MIN_SIZE = 64 * 1024
+
+# Seconds to use per-item validation before probing the bulk endpoint again
+_BATCH_REPROBE_INTERVAL = 300.0
+
+
+class _EndpointUnavailable(Exception):
+    """The server does not provide an optional endpoint."""
+
+
+def _endpoint_missing(response: httpx.Response) -> bool:
+    """
+    Whether an error response means the route itself does not exist.
+
+    A 404 for a missing route carries no error body, unlike the JSON error the
+    registry returns when a schema named in the request is not found.
+    """
+    if response.status_code in (405, 501):
+        return True
+    if response.status_code == 404:
+        try:
+            return not isinstance(orjson.loads(response.content), dict)
+        except orjson.JSONDecodeError:
+            return True
+    return False
+
+
+# Exception builders for error statuses with a dedicated exception type
+_ERROR_FACTORIES: Dict[
+    int, Callable[[str, Dict[str, Any], httpx.Response], SchemaRegistryError]
+] = {
+    401: lambda message, error_data, response: AuthenticationError(message),
+    403: lambda message, error_data, response: AuthorizationError(message),
+    404: lambda message, error_data, response: SchemaNotFoundError(schema_id=message),
+    409: lambda message, error_data, response: IncompatibleSchemaError(
+        error_data.get("incompatibilities", [message])
+    ),
+    429: _rate_limit_error,
+}
+
+
+async def _run_sized(size: int, fn: Callable[..., T], *args: Any) -> T:
+    """Call ``fn`` inline, or in a worker thread when ``size`` exceeds the offload threshold."""
+    if size > _OFFLOAD_MIN_SIZE:
+        return await asyncio.to_thread(fn, *args)
+    return fn(*args)
+
+
+def _canonical_schema_id(schema_id: str) -> str:
+    """Return the canonical form of a schema ID, raising locally if it is not a UUID."""
+    try:
+        return str(UUID(schema_id))
+    except ValueError:
+        raise SchemaNotFoundError(schema_id) from None
+
+
+def _compile_json_schema(content: str) -> Callable[[Any], Any]:
+    """Compile JSON Schema text into a validator that leaves its input unchanged."""
+    import fastjsonschema
+
+    # use_default=False: validation must not fill schema defaults into the caller's data
+    return cast(
+        Callable[[Any], Any], fastjsonschema.compile(orjson.loads(content), use_default=False)
+    )
+
 
 class SchemaRegistryClient:
     """
@@ -45,11 +157,18 @@ class SchemaRegistryClient:
 
     Features:
     - Async/await support
-    - Automatic retries with exponential backoff
+    - HTTP/2 multiplexing and tuned connection pooling
+    - Automatic retries with jittered exponential backoff
     - In-memory caching with TTL
     - Comprehensive error handling
     - Type-safe schema operations
 
+    Thread safety:
+        The schema, not-found and validator caches are guarded by a lock and
+        may be read and written from several threads. HTTP connections,
+        batching and in-flight request sharing belong to the event loop that
+        first uses the client, so create one client per event loop.
+
     Example:
         >>> async with SchemaRegistryClient(
         ...     base_url="http://localhost:8080",
@@ -74,6 +193,12 @@ class SchemaRegistryClient:
         max_retries: int = 3,
         cache_ttl: int = 300,
         cache_maxsize: int = 1000,
+        negative_cache_ttl: int = 30,
+        validator_cache_maxsize: int = 256,
+        batch_max_size: int = 64,
+        batch_max_delay: float = 0.005,
+        http2: bool = True,
+        compress_requests: bool = False,
     ):
         """
         Initialize the schema registry client.
@@ -82,29 +207,79 @@ class SchemaRegistryClient:
             base_url: Base URL of the schema registry (e.g., "http://localhost:8080")
             api_key: Optional API key for authentication
             timeout: Request timeout in seconds (default: 30)
-            max_retries: Maximum number of retry attempts (default: 3)
+            max_retries: Maximum number of attempts per request; retrying also
+                stops once twice the timeout has elapsed (default: 3)
             cache_ttl: Cache time-to-live in seconds (default: 300)
             cache_maxsize: Maximum number of cached items (default: 1000)
+            negative_cache_ttl: Seconds to remember that a schema ID was not
+                found (default: 30)
+            validator_cache_maxsize: Maximum number of compiled local validators
+                kept by validate_data_local (default: 256)
+            batch_max_size: Maximum items per batched validate request (default: 64)
+            batch_max_delay: Seconds a batched validate call may wait for others
+                to join its batch (default: 0.005)
+            http2: Negotiate HTTP/2 with TLS endpoints so concurrent requests
+                share one multiplexed connection (default: True)
+            compress_requests: Gzip schema, compatibility and batch request
+                bodies larger than 1 KB; the registry must accept
+                Content-Encoding: gzip (default: False)
         """
+        # Deferred so importing the package stays cheap
+        import cachetools
+        import tenacity
+
         self.base_url = base_url.rstrip("/")
-        self.api_key = api_key
         self.timeout = timeout
         self.max_retries = max_retries
 
         # Initialize cache
-        self._cache: TTLCache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+        # Keys are the schema ID for get_schema and a (namespace, name, version)
+        # tuple for get_schema_by_version
+        self._cache: "TLRUCache[Hashable, GetSchemaResponseStruct]" = cachetools.TLRUCache(
+            maxsize=cache_maxsize, ttu=lambda _key, _value, now: now + cache_ttl
+        )
 
-        # HTTP client
-        headers = {"Content-Type": "application/json"}
-        if api_key:
-            headers["Authorization"] = f"Bearer {api_key}"
+        # Schema IDs the server recently reported as not found
+        self._not_found: "TTLCache[str, bool]" = cachetools.TTLCache(
+            maxsize=cache_maxsize, ttl=negative_cache_ttl
+        )
+
+        # Compiled JSON Schema validators by schema ID (None = not locally validatable)
+        self._validator_cache: "LRUCache[str, Optional[Callable[[Any], Any]]]" = (
+            cachetools.LRUCache(maxsize=validator_cache_maxsize)
+        )
 
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers=headers,
-            timeout=timeout,
+        # Guards the three caches above. cachetools caches are not thread-safe,
+        # and even a lookup reorders the LRU, so reads take the lock as well.
+        self._cache_lock = threading.Lock()
+
+        # Coalescer for validate_data(..., batched=True)
+        self._batcher = _ValidateBatcher(
+            self._validate_batch, max_batch_size=batch_max_size, max_queue_time=batch_max_delay
+        )
+        # Monotonic time before which the bulk validate endpoint is known missing
+        self._batch_unavailable_until = 0.0
+
+        # In-flight schema fetches by cache key, shared by concurrent callers
+        self._inflight: Dict[Hashable, "asyncio.Task[GetSchemaResponseStruct]"] = {}
+
+        # Retry policy shared by all requests. Full-jitter backoff keeps clients
+        # from retrying in lockstep after an outage; the delay stop bounds the
+        # total time a call can spend retrying.
+        self._retrying: "AsyncRetrying" = tenacity.AsyncRetrying(
+            retry=tenacity.retry_if_exception_type((httpx.TimeoutException, ServerError)),
+            stop=tenacity.stop_after_attempt(max_retries) | tenacity.stop_after_delay(timeout * 2),
+            wait=tenacity.wait_random_exponential(multiplier=0.5, max=5),
+            reraise=True,
         )
 
+        # HTTP client, created on first request
+        self._headers: Dict[str, str] = {"Content-Type": "application/json"}
+        self._http2 = http2
+        self._compress_requests = compress_requests
+        self._http: Optional[httpx.AsyncClient] = None
+        self.api_key = api_key
+
     async def __aenter__(self) -> "SchemaRegistryClient":
         """Async context manager entry."""
         return self
@@ -113,51 +288,112 @@ class SchemaRegistryClient:
         """Async context manager exit."""
         await self.close()
 
+    @property
+    def api_key(self) -> Optional[str]:
+        """API key sent as a bearer token; can be changed after construction."""
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, api_key: Optional[str]) -> None:
+        self._api_key = api_key
+        if api_key:
+            self._headers["Authorization"] = f"Bearer {api_key}"
+        else:
+            self._headers.pop("Authorization", None)
+
+        if self._http is not None:
+            self._http.headers = self._headers
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """The underlying HTTP client, created on first use."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._headers,
+                timeout=self.timeout,
+                http2=self._http2,
+                limits=_DEFAULT_LIMITS,
+            )
+        return self._http
+
     async def close(self) -> None:
         """Close the HTTP client and cleanup resources."""
-        await self._client.aclose()
+        await self._batcher.aclose()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> bytes:
+        """
+        Send a request under the client's retry policy and return the raw body.
+
+        Timeouts and server errors are retried; any other error response is
+        raised as the matching SchemaRegistryError subclass. Callers pass the
+        body already encoded, so a retry resends the same bytes rather than
+        serializing the payload again.
+        """
+        # copy() gives each call its own attempt state; the policy itself is shared
+        return await self._retrying.copy()(self._send, method, url, **kwargs)
+
+    def _json_body(self, payload: bytes) -> Dict[str, Any]:
+        """Request arguments for an encoded JSON body, gzipped if it is large."""
+        if self._compress_requests and len(payload) > _GZIP_MIN_SIZE:
+            # Level 1: schemas are repetitive JSON and compress well even at the fastest level
+            return {
+                "content": gzip.compress(payload, compresslevel=1),
+                "headers": {"Content-Encoding": "gzip"},
+            }
+        return {"content": payload}
+
+    def _encode_schema(self, schema: Union[Schema, SchemaStruct]) -> Dict[str, Any]:
+        """Request arguments for registering ``schema``."""
+        return self._json_body(SCHEMA_ENCODER.encode(SchemaStruct.from_model(schema)))
+
+    async def _send(self, method: str, url: str, *, optional: bool = False, **kwargs: Any) -> bytes:
+        """
+        Send a single request attempt.
+
+        For an ``optional`` endpoint, a response showing the route does not
+        exist raises _EndpointUnavailable, which the retry policy passes through.
+        """
+        response = await self._client.request(method, url, **kwargs)
+        if optional and not response.is_success and _endpoint_missing(response):
+            raise _EndpointUnavailable(f"{method} {url}: {response.status_code}")
+        return self._parse_or_raise(response)
 
-    def _handle_response_error(self, response: httpx.Response) -> None:
-        """Handle HTTP error responses."""
+    def _parse_or_raise(self, response: httpx.Response) -> bytes:
+        """
+        Return the body of a successful response, or raise for an error response.
+
+        Successful bodies are returned undecoded so each caller parses them
+        exactly once into its result type; only error bodies are decoded here.
+        """
         if response.is_success:
-            return
+            return response.content
 
         status_code = response.status_code
 
         try:
-            error_data = response.json()
+            error_data = orjson.loads(response.content)
             message = error_data.get("message", response.text)
         except Exception:
+            error_data = {}
             message = response.text
 
-        if status_code == 401:
-            raise AuthenticationError(message)
-        elif status_code == 403:
-            raise AuthorizationError(message)
-        elif status_code == 404:
-            raise SchemaNotFoundError(schema_id=message)
-        elif status_code == 409:
-            incompatibilities = error_data.get("incompatibilities", [message])
-            raise IncompatibleSchemaError(incompatibilities)
-        elif status_code == 429:
-            retry_after = response.headers.get("Retry-After")
-            raise RateLimitError(retry_after=int(retry_after) if retry_after else None)
-        elif status_code >= 500:
+        factory = _ERROR_FACTORIES.get(status_code)
+        if factory is not None:
+            raise factory(message, error_data, response)
+        if status_code >= 500:
             raise ServerError(message)
-        else:
-            raise SchemaRegistryError(message, status_code=status_code)
+        raise SchemaRegistryError(message, status_code=status_code)
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, ServerError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-    )
-    async def register_schema(self, schema: Schema) -> RegisterSchemaResponse:
+    async def register_schema(self, schema: Union[Schema, SchemaStruct]) -> RegisterSchemaResponse:
         """
         Register a new schema.
 
         Args:
-            schema: Schema to register
+            schema: Schema to register (a Schema model or a SchemaStruct)
 
         Returns:
             RegisterSchemaResponse with schema_id, version, and created_at
@@ -167,121 +403,172 @@ class SchemaRegistryClient:
             AuthenticationError: If authentication fails
             SchemaRegistryError: For other errors
         """
-        logger.info(
-            f"Registering schema: {schema.namespace}.{schema.name} v{schema.version}"
-        )
+        # Versions are validated here, at the write boundary, rather than on
+        # every Schema construction
+        try:
+            _check_semver(schema.version)
+        except ValueError as e:
+            raise SchemaValidationError([str(e)]) from None
 
-        payload = schema.model_dump(mode="json", exclude_none=True)
+        logger.info("Registering schema: %s.%s v%s", schema.namespace, schema.name, schema.version)
 
-        response = await self._client.post("/api/v1/schemas", json=payload)
-        self._handle_response_error(response)
+        # Encoded once; retry attempts inside _request resend these bytes
+        request = await _run_sized(len(schema.content), self._encode_schema, schema)
 
-        data = response.json()
-        result = RegisterSchemaResponse(**data)
+        body = await self._request("POST", "/api/v1/schemas", **request)
 
-        # Invalidate cache for this schema
-        cache_key = f"{schema.namespace}.{schema.name}"
-        if cache_key in self._cache:
-            del self._cache[cache_key]
+        data = orjson.loads(body)
+        result = RegisterSchemaResponse.from_trusted(data)
 
-        logger.info(f"Registered schema with ID: {result.schema_id}")
+        # Invalidate cache for this schema version
+        with self._cache_lock:
+            self._cache.pop((schema.namespace, schema.name, schema.version), None)
+            self._not_found.pop(result.schema_id, None)
+
+        logger.info("Registered schema with ID: %s", result.schema_id)
         return result
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, ServerError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-    )
-    async def get_schema(self, schema_id: str, use_cache: bool = True) -> GetSchemaResponse:
+    async def get_schema(self, schema_id: str, use_cache: bool = True) -> GetSchemaResponseStruct:
         """
         Get a schema by ID.
 
+        Concurrent calls for the same schema share a single in-flight request.
+
         Args:
             schema_id: UUID of the schema
             use_cache: Whether to use cached result (default: True)
 
         Returns:
-            GetSchemaResponse with full schema details
+            GetSchemaResponseStruct with full schema details
 
         Raises:
             SchemaNotFoundError: If schema doesn't exist
             SchemaRegistryError: For other errors
         """
+        # Malformed IDs cannot exist on the server; don't spend a round trip on them
+        schema_id = _canonical_schema_id(schema_id)
+
         # Check cache first
-        cache_key = f"schema:{schema_id}"
-        if use_cache and cache_key in self._cache:
-            logger.debug(f"Cache hit for schema ID: {schema_id}")
-            return self._cache[cache_key]
+        if use_cache:
+            with self._cache_lock:
+                cached = self._cache.get(schema_id)
+                not_found = cached is None and schema_id in self._not_found
 
-        logger.info(f"Fetching schema: {schema_id}")
+            if cached is not None:
+                logger.debug("Cache hit for schema ID: %s", schema_id)
+                return cached
 
-        response = await self._client.get(f"/api/v1/schemas/{schema_id}")
-        self._handle_response_error(response)
+            if not_found:
+                logger.debug("Negative cache hit for schema ID: %s", schema_id)
+                raise SchemaNotFoundError(schema_id)
 
-        data = response.json()
-        result = GetSchemaResponse(**data)
+        try:
+            result = await self._single_flight(schema_id, lambda: self._fetch_schema(schema_id))
+        except SchemaNotFoundError as e:
+            with self._cache_lock:
+                self._not_found[schema_id] = True
+            # Same schema_id as a negative cache hit, not the server's message
+            raise SchemaNotFoundError(schema_id) from e
 
         # Cache the result
         if use_cache:
-            self._cache[cache_key] = result
+            with self._cache_lock:
+                self._cache[schema_id] = result
 
         return result
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, ServerError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-    )
+    async def _fetch_schema(self, schema_id: str) -> GetSchemaResponseStruct:
+        """Fetch a schema by ID from the server."""
+        logger.info("Fetching schema: %s", schema_id)
+
+        body = await self._request("GET", f"/api/v1/schemas/{schema_id}")
+
+        return GET_SCHEMA_DECODER.decode(body)
+
     async def get_schema_by_version(
         self, namespace: str, name: str, version: str
-    ) -> GetSchemaResponse:
+    ) -> GetSchemaResponseStruct:
         """
         Get a schema by namespace, name, and version.
 
+        Concurrent calls for the same version share a single in-flight request.
+
         Args:
             namespace: Schema namespace
             name: Schema name
             version: Schema version
 
         Returns:
-            GetSchemaResponse with full schema details
+            GetSchemaResponseStruct with full schema details
 
         Raises:
             SchemaNotFoundError: If schema doesn't exist
             SchemaRegistryError: For other errors
         """
         # Check cache
-        cache_key = f"schema:{namespace}.{name}:{version}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
-        logger.info(f"Fetching schema: {namespace}.{name} v{version}")
-
-        response = await self._client.get(
-            f"/api/v1/schemas/{namespace}/{name}/versions/{version}"
+        cache_key = (namespace, name, version)
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = await self._single_flight(
+            cache_key, lambda: self._fetch_schema_by_version(namespace, name, version)
         )
-        self._handle_response_error(response)
-
-        data = response.json()
-        result = GetSchemaResponse(**data)
 
         # Cache the result
-        self._cache[cache_key] = result
+        with self._cache_lock:
+            self._cache[cache_key] = result
 
         return result
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, ServerError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-    )
-    async def validate_data(self, schema_id: str, data: str | dict) -> ValidateResponse:
+    async def _fetch_schema_by_version(
+        self, namespace: str, name: str, version: str
+    ) -> GetSchemaResponseStruct:
+        """Fetch a schema by namespace, name, and version from the server."""
+        logger.info("Fetching schema: %s.%s v%s", namespace, name, version)
+
+        body = await self._request("GET", f"/api/v1/schemas/{namespace}/{name}/versions/{version}")
+
+        return GET_SCHEMA_DECODER.decode(body)
+
+    async def _single_flight(
+        self, key: Hashable, fetch: Callable[[], Coroutine[Any, Any, GetSchemaResponseStruct]]
+    ) -> GetSchemaResponseStruct:
+        """
+        Run ``fetch`` once per key at a time.
+
+        The fetch runs as its own task, which every caller for ``key`` awaits
+        through ``asyncio.shield``: cancelling one caller does not cancel the
+        fetch or the other callers sharing it. No lock is needed: all callers
+        run on the same event loop.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._fetch_done(key, t))
+        return await asyncio.shield(task)
+
+    def _fetch_done(self, key: Hashable, task: "asyncio.Task[GetSchemaResponseStruct]") -> None:
+        """Forget a finished fetch."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark any error as retrieved, in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def validate_data(
+        self, schema_id: str, data: str | dict, batched: bool = False
+    ) -> ValidateResponse:
         """
         Validate data against a schema.
 
         Args:
             schema_id: UUID of the schema to validate against
             data: Data to validate (JSON string or dict)
+            batched: Coalesce this call with other batched calls made within a
+                few milliseconds into one batch request (default: False)
 
         Returns:
             ValidateResponse with is_valid and errors
@@ -290,25 +577,142 @@ class SchemaRegistryClient:
             SchemaNotFoundError: If schema doesn't exist
             SchemaRegistryError: For other errors
         """
-        logger.info(f"Validating data against schema: {schema_id}")
-
         if isinstance(data, dict):
-            import json
+            data = orjson.dumps(data).decode()
+
+        if batched:
+            return await self._batcher.submit(schema_id, data)
 
-            data = json.dumps(data)
+        return await self._validate_one(schema_id, data)
+
+    async def _validate_one(self, schema_id: str, data: str) -> ValidateResponse:
+        """Validate a single serialized payload."""
+        logger.info("Validating data against schema: %s", schema_id)
 
         payload = {"schema_id": schema_id, "data": data}
 
-        response = await self._client.post("/api/v1/validate", json=payload)
-        self._handle_response_error(response)
+        body = await self._request("POST", "/api/v1/validate", content=orjson.dumps(payload))
+
+        return ValidateResponse.from_trusted(orjson.loads(body))
+
+    async def _validate_batch(
+        self, items: List[Tuple[str, str]]
+    ) -> Sequence[Union[ValidateResponse, BaseException]]:
+        """Validate a coalesced batch, falling back to one request per item."""
+        if time.monotonic() >= self._batch_unavailable_until:
+            try:
+                return await self._post_validate_batch(items)
+            except _EndpointUnavailable:
+                logger.warning(
+                    "Batch validation endpoint unavailable; validating items individually"
+                )
+                self._batch_unavailable_until = time.monotonic() + _BATCH_REPROBE_INTERVAL
+            except SchemaNotFoundError:
+                # One unknown schema fails the whole bulk request; validate items
+                # one by one so only the callers using that schema see the error
+                logger.debug("Batch named an unknown schema; validating items individually")
+
+        return await asyncio.gather(
+            *(self._validate_one(schema_id, data) for schema_id, data in items),
+            return_exceptions=True,
+        )
 
-        return ValidateResponse(**response.json())
+    async def _post_validate_batch(self, items: List[Tuple[str, str]]) -> List[ValidateResponse]:
+        """POST a batch to the bulk endpoint, which the server may not provide."""
+        logger.info("Validating batch of %d items", len(items))
+
+        payload = [{"schema_id": schema_id, "data": data} for schema_id, data in items]
+
+        body = await self._request(
+            "POST",
+            "/api/v1/validate/batch",
+            optional=True,
+            **self._json_body(orjson.dumps(payload)),
+        )
+
+        results = [ValidateResponse.from_trusted(item) for item in orjson.loads(body)]
+        if len(results) != len(items):
+            raise SchemaRegistryError(
+                f"Batch validation returned {len(results)} results for {len(items)} items"
+            )
+        return results
+
+    async def validate_data_local(
+        self, schema_id: str, data: str | Dict[str, Any], *, fallback_to_server: bool = True
+    ) -> ValidateResponse:
+        """
+        Validate data against a JSON Schema in-process.
+
+        The schema is fetched once and compiled with fastjsonschema (install the
+        ``json`` extra); the compiled validator is cached by schema ID, so later
+        calls for the same schema do not touch the network. Only the first
+        validation error is reported.
+
+        Args:
+            schema_id: UUID of the schema to validate against
+            data: Data to validate (JSON string or dict)
+            fallback_to_server: Use validate_data when the schema cannot be
+                compiled locally (default: True)
+
+        Returns:
+            ValidateResponse with is_valid and errors
+
+        Raises:
+            SchemaNotFoundError: If schema doesn't exist
+            SchemaRegistryError: If the schema cannot be validated locally and
+                fallback_to_server is False
+        """
+        schema_id = _canonical_schema_id(schema_id)
+
+        with self._cache_lock:
+            # None is cached too, for schemas that cannot be validated locally
+            compiled = schema_id in self._validator_cache
+            validator = self._validator_cache.get(schema_id)
+        if not compiled:
+            validator = await self._compile_validator(schema_id)
+
+        if validator is None:
+            if fallback_to_server:
+                return await self.validate_data(schema_id, data)
+            raise SchemaRegistryError(f"Schema cannot be validated locally: {schema_id}")
+
+        if isinstance(data, str):
+            try:
+                data = orjson.loads(data)
+            except orjson.JSONDecodeError as e:
+                return ValidateResponse(is_valid=False, errors=[f"Invalid JSON: {e}"])
+
+        import fastjsonschema
+
+        try:
+            validator(data)
+        except fastjsonschema.JsonSchemaValueException as e:
+            return ValidateResponse(is_valid=False, errors=[e.message])
+
+        return ValidateResponse(is_valid=True)
+
+    async def _compile_validator(self, schema_id: str) -> Optional[Callable[[Any], Any]]:
+        """Fetch and compile a schema for local validation, caching the outcome."""
+        try:
+            import fastjsonschema  # noqa: F401
+        except ImportError:
+            return None
+
+        schema = await self.get_schema(schema_id)
+
+        validator = None
+        if schema.format == SchemaFormat.JSON_SCHEMA:
+            # Compiling generates and execs code and may fetch remote $refs with
+            # blocking I/O, so keep it off the event loop
+            try:
+                validator = await asyncio.to_thread(_compile_json_schema, schema.content)
+            except Exception as e:
+                logger.warning("Cannot compile schema %s for local validation: %s", schema_id, e)
+
+        with self._cache_lock:
+            self._validator_cache[schema_id] = validator
+        return validator
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, ServerError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-    )
     async def check_compatibility(
         self,
         schema_id: str,
@@ -330,23 +734,19 @@ class SchemaRegistryClient:
             SchemaNotFoundError: If schema doesn't exist
             SchemaRegistryError: For other errors
         """
-        logger.info(f"Checking compatibility for schema: {schema_id} (mode: {mode})")
+        logger.info("Checking compatibility for schema: %s (mode: %s)", schema_id, mode.value)
 
         payload = {"schema_id": schema_id, "new_schema": new_schema_content, "mode": mode.value}
 
-        response = await self._client.post("/api/v1/compatibility/check", json=payload)
-        self._handle_response_error(response)
+        body = await self._request(
+            "POST", "/api/v1/compatibility/check", **self._json_body(orjson.dumps(payload))
+        )
 
-        return CompatibilityResult(**response.json())
+        return CompatibilityResult.from_trusted(orjson.loads(body))
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, ServerError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-    )
     async def search_schemas(
         self, query: str, limit: int = 10, offset: int = 0
-    ) -> List[SearchResult]:
+    ) -> List[SearchResultStruct]:
         """
         Search for schemas using full-text search.
 
@@ -356,27 +756,20 @@ class SchemaRegistryClient:
             offset: Result offset for pagination (default: 0)
 
         Returns:
-            List of SearchResult objects
+            List of SearchResultStruct objects
 
         Raises:
             SchemaRegistryError: For errors
         """
-        logger.info(f"Searching schemas: query='{query}', limit={limit}, offset={offset}")
+        logger.info("Searching schemas: query='%s', limit=%s, offset=%s", query, limit, offset)
 
-        response = await self._client.get(
-            "/api/v1/search", params={"q": query, "limit": limit, "offset": offset}
+        body = await self._request(
+            "GET", "/api/v1/search", params={"q": query, "limit": limit, "offset": offset}
         )
-        self._handle_response_error(response)
 
-        results = response.json()
-        return [SearchResult(**result) for result in results]
+        return await _run_sized(len(body), SEARCH_RESULTS_DECODER.decode, body)
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, ServerError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-    )
-    async def list_versions(self, namespace: str, name: str) -> List[SchemaVersion]:
+    async def list_versions(self, namespace: str, name: str) -> List[SchemaVersionStruct]:
         """
         List all versions of a schema.
 
@@ -385,25 +778,18 @@ class SchemaRegistryClient:
             name: Schema name
 
         Returns:
-            List of SchemaVersion objects
+            List of SchemaVersionStruct objects
 
         Raises:
             SchemaNotFoundError: If schema doesn't exist
             SchemaRegistryError: For other errors
         """
-        logger.info(f"Listing versions for schema: {namespace}.{name}")
+        logger.info("Listing versions for schema: %s.%s", namespace, name)
 
-        response = await self._client.get(f"/api/v1/schemas/{namespace}/{name}/versions")
-        self._handle_response_error(response)
+        body = await self._request("GET", f"/api/v1/schemas/{namespace}/{name}/versions")
 
-        versions = response.json()
-        return [SchemaVersion(**v) for v in versions]
+        return await _run_sized(len(body), SCHEMA_VERSIONS_DECODER.decode, body)
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, ServerError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-    )
     async def delete_schema(self, schema_id: str) -> None:
         """
         Delete a schema.
@@ -416,23 +802,21 @@ class SchemaRegistryClient:
             AuthorizationError: If user lacks delete permission
             SchemaRegistryError: For other errors
         """
-        logger.info(f"Deleting schema: {schema_id}")
+        schema_id = _canonical_schema_id(schema_id)
 
-        response = await self._client.delete(f"/api/v1/schemas/{schema_id}")
-        self._handle_response_error(response)
+        logger.info("Deleting schema: %s", schema_id)
 
-        # Invalidate cache
-        cache_key = f"schema:{schema_id}"
-        if cache_key in self._cache:
-            del self._cache[cache_key]
+        await self._request("DELETE", f"/api/v1/schemas/{schema_id}")
 
-        logger.info(f"Deleted schema: {schema_id}")
+        # Invalidate cache, including the by-version entry if we know it
+        with self._cache_lock:
+            cached = self._cache.pop(schema_id, None)
+            if cached is not None:
+                self._cache.pop((cached.namespace, cached.name, cached.version), None)
+            self._validator_cache.pop(schema_id, None)
+
+        logger.info("Deleted schema: %s", schema_id)
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, ServerError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-    )
     async def health_check(self) -> Dict[str, Any]:
         """
         Check the health of the schema registry.
@@ -443,11 +827,13 @@ class SchemaRegistryClient:
         Raises:
             ServerError: If service is unhealthy
         """
-        response = await self._client.get("/health")
-        self._handle_response_error(response)
-        return response.json()
+        body = await self._request("GET", "/health")
+        return orjson.loads(body)
 
     def clear_cache(self) -> None:
         """Clear the in-memory cache."""
-        self._cache.clear()
+        with self._cache_lock:
+            self._cache.clear()
+            self._not_found.clear()
+            self._validator_cache.clear()
         logger.info("Cache cleared")
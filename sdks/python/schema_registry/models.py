@@ -2,11 +2,44 @@
 Data models for the LLM Schema Registry Python SDK.
 """
 
+import re
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import cache, lru_cache
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, TypeAdapter
+
+_ciso_parse_datetime: Optional[Callable[[str], datetime]] = None
+try:
+    import ciso8601
+
+    _ciso_parse_datetime = ciso8601.parse_datetime
+except ImportError:
+    pass
+
+# major.minor.patch, numeric parts without leading zeros (per semver.org)
+_SEMVER_RE = re.compile(r"\A(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)\Z")
+
+
+@lru_cache(maxsize=1024)
+def _check_semver(v: str) -> None:
+    """Raise ValueError unless ``v`` is a semver version; valid versions are memoized."""
+    if not _SEMVER_RE.match(v):
+        raise ValueError("Version must be in semver format (major.minor.patch)")
 
 
 class SchemaFormat(str, Enum):
@@ -16,6 +49,13 @@ class SchemaFormat(str, Enum):
     AVRO = "avro"
     PROTOBUF = "protobuf"
 
+    @classmethod
+    def _missing_(cls, value: object) -> Optional["SchemaFormat"]:
+        # Case-insensitive fallback, e.g. SchemaFormat("AVRO")
+        if isinstance(value, str):
+            return _SCHEMA_FORMAT_LOOKUP.get(value.lower())
+        return None
+
 
 class CompatibilityMode(str, Enum):
     """Schema compatibility checking modes."""
@@ -28,18 +68,70 @@ class CompatibilityMode(str, Enum):
     FULL_TRANSITIVE = "full_transitive"
     NONE = "none"
 
+    @classmethod
+    def _missing_(cls, value: object) -> Optional["CompatibilityMode"]:
+        # Case-insensitive fallback, e.g. CompatibilityMode("BACKWARD")
+        if isinstance(value, str):
+            return _COMPATIBILITY_MODE_LOOKUP.get(value.lower())
+        return None
+
+
+# Value -> member tables for decoding trusted responses: one dict probe on an
+# interned key instead of a trip through Enum.__call__. The enums' _missing_
+# hooks reuse them for case-insensitive lookups.
+_SCHEMA_FORMAT_LOOKUP = {sys.intern(m.value): m for m in SchemaFormat}
+_COMPATIBILITY_MODE_LOOKUP = {sys.intern(m.value): m for m in CompatibilityMode}
+
+
+def _schema_format(value: Any) -> SchemaFormat:
+    return _SCHEMA_FORMAT_LOOKUP.get(value) or SchemaFormat(value)
+
+
+def _compatibility_mode(value: Any) -> CompatibilityMode:
+    return _COMPATIBILITY_MODE_LOOKUP.get(value) or CompatibilityMode(value)
+
+
+def _intern_tags(value: Any) -> Any:
+    """Freeze a tag sequence into a tuple of interned strings."""
+    if isinstance(value, (list, tuple)):
+        # Exact type check: sys.intern rejects str subclasses. Anything else is
+        # passed through for the tuple validator to reject.
+        return tuple(sys.intern(t) if type(t) is str else t for t in value)  # noqa: E721
+    return value
+
+
+# Tags repeat heavily across schemas; interning lets equal tags share one object
+_InternedTags = Annotated[Tuple[str, ...], BeforeValidator(_intern_tags)]
+
 
 class SchemaMetadata(BaseModel):
     """Metadata for a schema."""
 
+    model_config = ConfigDict(frozen=True)
+
     description: Optional[str] = None
-    tags: List[str] = Field(default_factory=list)
+    tags: _InternedTags = ()
     owner: Optional[str] = None
     custom: Dict[str, Any] = Field(default_factory=dict)
 
 
+def _trusted_metadata(data: Dict[str, Any]) -> SchemaMetadata:
+    """Build metadata from server data without validating it."""
+    tags = data.get("tags")
+    if tags:
+        data = {**data, "tags": _intern_tags(tags)}
+    return SchemaMetadata.model_construct(**data)
+
+
 class Schema(BaseModel):
-    """Schema definition."""
+    """
+    Schema definition.
+
+    ``version`` is checked for semver format when the schema is registered,
+    not on construction, so schemas rebuilt from server data skip the check.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     namespace: str = Field(..., description="Schema namespace (e.g., 'telemetry')")
     name: str = Field(..., description="Schema name (e.g., 'InferenceEvent')")
@@ -48,30 +140,85 @@ class Schema(BaseModel):
     content: str = Field(..., description="Schema content (JSON/Avro/Protobuf)")
     metadata: Optional[SchemaMetadata] = None
 
-    @field_validator("version")
+
+_DATETIME_ADAPTER: "TypeAdapter[datetime]" = TypeAdapter(datetime)
+
+
+def _iso_datetime(value: Any) -> Any:
+    """Parse an ISO 8601 string with ciso8601 when installed; pass anything else through."""
+    if _ciso_parse_datetime is not None and isinstance(value, str):
+        try:
+            return _ciso_parse_datetime(value)
+        except ValueError:
+            # Leave formats ciso8601 does not handle to pydantic
+            pass
+    return value
+
+
+def _parse_datetime(value: Any) -> datetime:
+    """Convert a timestamp from server data to a datetime."""
+    value = _iso_datetime(value)
+    if isinstance(value, datetime):
+        return value
+    return _DATETIME_ADAPTER.validate_python(value)
+
+
+# ciso8601 (the ``speedups`` extra) parses the common case before pydantic sees it
+_Timestamp = Annotated[datetime, BeforeValidator(_iso_datetime)]
+
+M = TypeVar("M", bound="TrustedModel")
+
+
+class TrustedModel(BaseModel):
+    """
+    Base for response models decoded from registry responses.
+
+    ``from_trusted`` builds an instance with ``model_construct`` and skips
+    field validation; only the fields named in ``_trusted_coercions`` are
+    converted from their JSON form. Use ``model_validate`` for untrusted input.
+    Instances are immutable.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    _trusted_coercions: ClassVar[Dict[str, Callable[[Any], Any]]] = {}
+
     @classmethod
-    def validate_version(cls, v: str) -> str:
-        """Validate semantic versioning format."""
-        parts = v.split(".")
-        if len(parts) != 3:
-            raise ValueError("Version must be in semver format (major.minor.patch)")
-        for part in parts:
-            if not part.isdigit():
-                raise ValueError(f"Version part must be numeric: {part}")
-        return v
-
-
-class RegisterSchemaResponse(BaseModel):
+    def from_trusted(cls: Type[M], data: Dict[str, Any]) -> M:
+        """Build an instance from server data without validating it."""
+        if cls._trusted_coercions:
+            data = dict(data)
+            for name, coerce in cls._trusted_coercions.items():
+                value = data.get(name)
+                if value is not None:
+                    data[name] = coerce(value)
+        return cls.model_construct(**data)
+
+
+@dataclass(slots=True, frozen=True)
+class RegisterSchemaResponse:
     """Response from schema registration."""
 
-    schema_id: str = Field(..., description="Unique schema ID (UUID)")
-    version: str = Field(..., description="Registered version")
-    created_at: datetime = Field(..., description="Creation timestamp")
+    schema_id: str
+    version: str
+    created_at: datetime
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "RegisterSchemaResponse":
+        """Build a response from server data without validating it."""
+        return cls(data["schema_id"], data["version"], _parse_datetime(data["created_at"]))
 
 
-class GetSchemaResponse(BaseModel):
+class GetSchemaResponse(TrustedModel):
     """Response from schema retrieval."""
 
+    _trusted_coercions: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        "format": _schema_format,
+        "metadata": _trusted_metadata,
+        "created_at": _parse_datetime,
+        "updated_at": _parse_datetime,
+    }
+
     schema_id: str
     namespace: str
     name: str
@@ -79,42 +226,87 @@ class GetSchemaResponse(BaseModel):
     format: SchemaFormat
     content: str
     metadata: Optional[SchemaMetadata] = None
-    created_at: datetime
-    updated_at: datetime
+    created_at: _Timestamp
+    updated_at: _Timestamp
 
 
-class ValidateResponse(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ValidateResponse:
     """Response from data validation."""
 
-    is_valid: bool = Field(..., description="Whether data is valid")
-    errors: List[str] = Field(default_factory=list, description="Validation error messages")
+    is_valid: bool
+    errors: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "ValidateResponse":
+        """Build a response from server data without validating it."""
+        return cls(data["is_valid"], data.get("errors") or [])
 
 
-class CompatibilityResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CompatibilityResult:
     """Result of compatibility checking."""
 
-    is_compatible: bool = Field(..., description="Whether schemas are compatible")
-    incompatibilities: List[str] = Field(
-        default_factory=list, description="List of incompatibility issues"
-    )
-    mode: CompatibilityMode = Field(..., description="Compatibility mode used")
+    is_compatible: bool
+    incompatibilities: List[str] = field(default_factory=list)
+    mode: CompatibilityMode = field(kw_only=True)
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "CompatibilityResult":
+        """Build a result from server data without validating it."""
+        return cls(
+            data["is_compatible"],
+            data.get("incompatibilities") or [],
+            mode=_compatibility_mode(data["mode"]),
+        )
 
-class SchemaVersion(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class SchemaVersion:
     """Schema version information."""
 
     version: str
     schema_id: str
     created_at: datetime
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "SchemaVersion":
+        """Build a version entry from server data without validating it."""
+        return cls(data["version"], data["schema_id"], _parse_datetime(data["created_at"]))
+
 
-class SearchResult(BaseModel):
+class SearchResult(TrustedModel):
     """Schema search result."""
 
+    _trusted_coercions: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        "tags": _intern_tags,
+    }
+
     schema_id: str
     namespace: str
     name: str
     version: str
     description: Optional[str] = None
-    tags: List[str] = Field(default_factory=list)
-    score: float = Field(..., description="Relevance score")
+    tags: _InternedTags = ()
+    score: float
+
+
+# Validating decoders for untrusted payloads (the client decodes its own responses
+# via from_trusted and the msgspec structs). Building a TypeAdapter walks the model
+# schema, so each is built on first use and then reused.
+@cache
+def get_schema_response_adapter() -> "TypeAdapter[GetSchemaResponse]":
+    """Shared validator for get_schema payloads."""
+    return TypeAdapter(GetSchemaResponse)
+
+
+@cache
+def search_results_adapter() -> "TypeAdapter[List[SearchResult]]":
+    """Shared validator for search result lists."""
+    return TypeAdapter(List[SearchResult])
+
+
+@cache
+def schema_versions_adapter() -> "TypeAdapter[List[SchemaVersion]]":
+    """Shared validator for schema version lists."""
+    return TypeAdapter(List[SchemaVersion])
@@ -0,0 +1,28 @@
+"""
+Shared fixtures for the Python SDK tests.
+
+HTTP traffic is served by respx routes on ``registry``; nothing touches the
+network.
+"""
+
+import pytest
+import respx
+import tenacity
+
+from helpers import BASE_URL
+from schema_registry import SchemaRegistryClient
+
+
+@pytest.fixture
+def registry():
+    with respx.mock(base_url=BASE_URL, assert_all_called=False) as mock:
+        yield mock
+
+
+@pytest.fixture
+async def client(registry):
+    client = SchemaRegistryClient(BASE_URL, api_key="test-key")
+    # Keep the retry policy but skip its backoff sleeps
+    client._retrying = client._retrying.copy(wait=tenacity.wait_none())
+    yield client
+    await client.close()
@@ -0,0 +1,26 @@
+"""
+Constants and response bodies shared by the Python SDK tests.
+"""
+
+from typing import Any, Dict
+
+BASE_URL = "http://registry.test"
+SCHEMA_ID = "123e4567-e89b-12d3-a456-426614174000"
+TIMESTAMP = "2025-01-01T12:00:00Z"
+
+
+def schema_body(**overrides: Any) -> Dict[str, Any]:
+    """A get_schema response body, with ``overrides`` applied."""
+    body = {
+        "schema_id": SCHEMA_ID,
+        "namespace": "telemetry",
+        "name": "InferenceEvent",
+        "version": "1.0.0",
+        "format": "json_schema",
+        "content": '{"type": "object"}',
+        "metadata": {"description": "Inference events", "tags": ["llm"], "custom": {}},
+        "created_at": TIMESTAMP,
+        "updated_at": TIMESTAMP,
+    }
+    body.update(overrides)
+    return body
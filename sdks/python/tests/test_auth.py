@@ -0,0 +1,21 @@
+"""
+Tests for the Authorization header.
+"""
+
+from helpers import SCHEMA_ID, schema_body
+
+
+async def test_api_key_changes_apply_to_later_requests(client, registry):
+    route = registry.get(f"/api/v1/schemas/{SCHEMA_ID}").respond(json=schema_body())
+
+    await client.get_schema(SCHEMA_ID, use_cache=False)
+    assert route.calls.last.request.headers["Authorization"] == "Bearer test-key"
+
+    client.api_key = "rotated-key"
+    await client.get_schema(SCHEMA_ID, use_cache=False)
+    assert route.calls.last.request.headers["Authorization"] == "Bearer rotated-key"
+
+    client.api_key = None
+    await client.get_schema(SCHEMA_ID, use_cache=False)
+    assert "Authorization" not in route.calls.last.request.headers
+    assert client.api_key is None
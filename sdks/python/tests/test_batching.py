@@ -0,0 +1,136 @@
+"""
+Tests for batched validate_data calls.
+"""
+
+import asyncio
+import time
+
+import httpx
+import orjson
+import pytest
+
+from helpers import SCHEMA_ID
+from schema_registry import SchemaNotFoundError
+from schema_registry._batching import _ValidateBatcher
+from schema_registry.client import _BATCH_REPROBE_INTERVAL
+from schema_registry.models import ValidateResponse
+
+OTHER_SCHEMA_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def batch_response(request):
+    items = orjson.loads(request.content)
+    return [{"is_valid": True, "errors": []} for _ in items]
+
+
+async def test_batcher_coalesces_and_dedupes():
+    batches = []
+
+    async def process(items):
+        batches.append(items)
+        return [ValidateResponse(is_valid=True) for _ in items]
+
+    batcher = _ValidateBatcher(process, max_batch_size=10, max_queue_time=0.01)
+    results = await asyncio.gather(
+        batcher.submit(SCHEMA_ID, "1"),
+        batcher.submit(SCHEMA_ID, "2"),
+        batcher.submit(SCHEMA_ID, "1"),
+    )
+
+    assert [r.is_valid for r in results] == [True, True, True]
+    assert batches == [[(SCHEMA_ID, "1"), (SCHEMA_ID, "2")]]
+
+
+async def test_batcher_flushes_at_max_batch_size():
+    batches = []
+
+    async def process(items):
+        batches.append(items)
+        return [ValidateResponse(is_valid=True) for _ in items]
+
+    # A queue time far beyond the test's lifetime: only the size limit can flush
+    batcher = _ValidateBatcher(process, max_batch_size=2, max_queue_time=60)
+    await asyncio.gather(batcher.submit(SCHEMA_ID, "1"), batcher.submit(SCHEMA_ID, "2"))
+
+    assert len(batches) == 1
+
+
+async def test_batcher_delivers_per_item_exceptions():
+    async def process(items):
+        return [ValidateResponse(is_valid=True), SchemaNotFoundError(OTHER_SCHEMA_ID)]
+
+    batcher = _ValidateBatcher(process)
+    ok, failed = await asyncio.gather(
+        batcher.submit(SCHEMA_ID, "1"),
+        batcher.submit(OTHER_SCHEMA_ID, "1"),
+        return_exceptions=True,
+    )
+
+    assert ok.is_valid
+    assert isinstance(failed, SchemaNotFoundError)
+
+
+async def test_batched_calls_share_one_request(client, registry):
+    route = registry.post("/api/v1/validate/batch").mock(
+        side_effect=lambda request: httpx.Response(200, json=batch_response(request))
+    )
+
+    results = await asyncio.gather(
+        *(client.validate_data(SCHEMA_ID, {"i": i}, batched=True) for i in range(5))
+    )
+
+    assert all(r.is_valid for r in results)
+    assert route.call_count == 1
+    assert len(orjson.loads(route.calls.last.request.content)) == 5
+
+
+async def test_unknown_schema_in_batch_falls_back_without_disabling(client, registry):
+    batch = registry.post("/api/v1/validate/batch").respond(404, json={"message": OTHER_SCHEMA_ID})
+
+    def validate_one(request):
+        if orjson.loads(request.content)["schema_id"] == OTHER_SCHEMA_ID:
+            return httpx.Response(404, json={"message": OTHER_SCHEMA_ID})
+        return httpx.Response(200, json={"is_valid": True, "errors": []})
+
+    registry.post("/api/v1/validate").mock(side_effect=validate_one)
+
+    ok, failed = await asyncio.gather(
+        client.validate_data(SCHEMA_ID, "{}", batched=True),
+        client.validate_data(OTHER_SCHEMA_ID, "{}", batched=True),
+        return_exceptions=True,
+    )
+
+    assert ok.is_valid
+    assert isinstance(failed, SchemaNotFoundError)
+
+    # The bulk endpoint exists, so the next batch goes to it again
+    await client.validate_data(SCHEMA_ID, "{}", batched=True)
+    assert batch.call_count == 2
+
+
+@pytest.mark.parametrize("status", [404, 405, 501])
+async def test_missing_endpoint_is_reprobed_after_interval(client, registry, status):
+    batch = registry.post("/api/v1/validate/batch").respond(status)
+    validate = registry.post("/api/v1/validate").respond(json={"is_valid": True, "errors": []})
+
+    await client.validate_data(SCHEMA_ID, "{}", batched=True)
+    await client.validate_data(SCHEMA_ID, "{}", batched=True)
+    assert batch.call_count == 1
+    assert validate.call_count == 2
+    assert client._batch_unavailable_until > time.monotonic() + _BATCH_REPROBE_INTERVAL - 5
+
+    # Patching time.monotonic would also freeze the event loop's clock, so
+    # move the deadline into the past instead
+    client._batch_unavailable_until -= _BATCH_REPROBE_INTERVAL
+    await client.validate_data(SCHEMA_ID, "{}", batched=True)
+    assert batch.call_count == 2
+
+
+@pytest.mark.parametrize("status", [400, 500])
+async def test_other_batch_errors_reach_callers(client, registry, status):
+    registry.post("/api/v1/validate/batch").respond(status, json={"message": "boom"})
+
+    with pytest.raises(Exception) as excinfo:
+        await client.validate_data(SCHEMA_ID, "{}", batched=True)
+
+    assert excinfo.value.status_code == status
@@ -0,0 +1,57 @@
+"""
+Tests for the columnar SearchResultBatch view.
+"""
+
+import pytest
+
+from schema_registry import SearchResultBatch, SearchResultStruct
+
+np = pytest.importorskip("numpy")
+
+
+def search_result(i, score):
+    return SearchResultStruct(
+        schema_id=f"schema-{i}",
+        namespace="telemetry",
+        name=f"Event{i}",
+        version="1.0.0",
+        score=score,
+        description=None if i % 2 else f"Event {i}",
+        tags=("llm",),
+    )
+
+
+@pytest.fixture
+def records():
+    return [search_result(i, score) for i, score in enumerate([0.2, 0.9, 0.5, 0.7])]
+
+
+def test_from_records_builds_columns(records):
+    batch = SearchResultBatch.from_records(records)
+
+    assert len(batch) == 4
+    assert batch.scores.dtype == np.float64
+    assert batch.scores.tolist() == [0.2, 0.9, 0.5, 0.7]
+    assert batch.schema_ids.tolist() == [r.schema_id for r in records]
+
+
+def test_getitem_round_trips_records(records):
+    batch = SearchResultBatch.from_records(records)
+
+    assert [batch[i] for i in range(len(batch))] == records
+    assert list(batch[1:3]) == records[1:3]
+
+
+def test_top_k_returns_best_first(records):
+    batch = SearchResultBatch.from_records(records)
+
+    assert [r.schema_id for r in batch.top_k(2)] == ["schema-1", "schema-3"]
+    assert len(batch.top_k(10)) == 4
+    assert len(batch.top_k(0)) == 0
+
+
+def test_empty_batch():
+    batch = SearchResultBatch.from_records([])
+
+    assert len(batch) == 0
+    assert len(batch.top_k(3)) == 0
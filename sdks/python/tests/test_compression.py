@@ -0,0 +1,52 @@
+"""
+Tests for gzip-compressed request bodies.
+"""
+
+import gzip
+import json
+
+import orjson
+import pytest
+
+from helpers import BASE_URL, SCHEMA_ID, TIMESTAMP
+from schema_registry import Schema, SchemaFormat, SchemaRegistryClient
+
+# Well past the 1 KB compression threshold
+LARGE_CONTENT = json.dumps(
+    {"type": "object", "properties": {f"field_{i}": {"type": "string"} for i in range(100)}}
+)
+
+
+@pytest.fixture
+def register_route(registry):
+    return registry.post("/api/v1/schemas").respond(
+        201, json={"schema_id": SCHEMA_ID, "version": "1.0.0", "created_at": TIMESTAMP}
+    )
+
+
+def large_schema():
+    return Schema(
+        namespace="telemetry",
+        name="InferenceEvent",
+        version="1.0.0",
+        format=SchemaFormat.JSON_SCHEMA,
+        content=LARGE_CONTENT,
+    )
+
+
+async def test_requests_are_not_compressed_by_default(client, register_route):
+    await client.register_schema(large_schema())
+
+    request = register_route.calls.last.request
+    assert "Content-Encoding" not in request.headers
+    assert orjson.loads(request.content)["content"] == LARGE_CONTENT
+
+
+async def test_large_bodies_are_gzipped_when_enabled(register_route):
+    async with SchemaRegistryClient(BASE_URL, compress_requests=True) as client:
+        await client.register_schema(large_schema())
+
+    request = register_route.calls.last.request
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert request.headers["Content-Type"] == "application/json"
+    assert orjson.loads(gzip.decompress(request.content))["content"] == LARGE_CONTENT
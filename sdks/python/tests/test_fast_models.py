@@ -0,0 +1,40 @@
+"""
+Tests for the msgspec wire types.
+"""
+
+import sys
+
+import msgspec
+import orjson
+
+from helpers import schema_body
+from schema_registry import SchemaMetadataStruct
+from schema_registry._fast_models import GET_SCHEMA_DECODER
+
+
+def test_custom_metadata_does_not_hold_the_response_body():
+    body = b'{"description": "d", "custom": {"k": 1}, "padding": "' + b"x" * 1024 + b'"}'
+    refcount = sys.getrefcount(body)
+
+    metadata = msgspec.json.decode(body, type=SchemaMetadataStruct)
+
+    assert sys.getrefcount(body) == refcount
+    assert bytes(metadata.raw_custom) == b'{"k": 1}'
+    assert metadata.custom == {"k": 1}
+
+
+def test_empty_custom_metadata_round_trips():
+    metadata = msgspec.json.decode(b'{"description": "d"}', type=SchemaMetadataStruct)
+
+    assert metadata.custom == {}
+    assert msgspec.json.encode(metadata) == b'{"description":"d"}'
+
+
+def test_schema_response_does_not_hold_the_response_body():
+    body = orjson.dumps(schema_body(content='{"type": "string"}'))
+    refcount = sys.getrefcount(body)
+
+    schema = GET_SCHEMA_DECODER.decode(body)
+
+    assert sys.getrefcount(body) == refcount
+    assert schema.content == '{"type": "string"}'
@@ -0,0 +1,55 @@
+"""
+Tests for validate_data_local.
+"""
+
+import json
+
+from helpers import SCHEMA_ID, schema_body
+
+
+async def test_validates_against_compiled_schema(client, registry):
+    content = json.dumps({"type": "object", "required": ["model"]})
+    route = registry.get(f"/api/v1/schemas/{SCHEMA_ID}").respond(json=schema_body(content=content))
+
+    valid = await client.validate_data_local(SCHEMA_ID, {"model": "gpt-4"})
+    invalid = await client.validate_data_local(SCHEMA_ID, '{"prompt": "hi"}')
+
+    assert valid.is_valid
+    assert not invalid.is_valid
+    assert invalid.errors
+    # The compiled validator is cached; the schema is fetched once
+    assert route.call_count == 1
+
+
+async def test_does_not_fill_in_schema_defaults(client, registry):
+    content = json.dumps(
+        {"type": "object", "properties": {"retries": {"type": "integer", "default": 5}}}
+    )
+    registry.get(f"/api/v1/schemas/{SCHEMA_ID}").respond(json=schema_body(content=content))
+
+    data = {}
+    result = await client.validate_data_local(SCHEMA_ID, data)
+
+    assert result.is_valid
+    assert data == {}
+
+
+async def test_uncompilable_schema_falls_back_to_server(client, registry):
+    # fastjsonschema raises URLError, not JsonSchemaDefinitionException, for this $ref
+    content = json.dumps({"$ref": "unknown-scheme://schemas/event.json"})
+    registry.get(f"/api/v1/schemas/{SCHEMA_ID}").respond(json=schema_body(content=content))
+    validate = registry.post("/api/v1/validate").respond(json={"is_valid": True, "errors": []})
+
+    result = await client.validate_data_local(SCHEMA_ID, {"model": "gpt-4"})
+
+    assert result.is_valid
+    assert validate.call_count == 1
+
+
+async def test_invalid_json_string(client, registry):
+    registry.get(f"/api/v1/schemas/{SCHEMA_ID}").respond(json=schema_body())
+
+    result = await client.validate_data_local(SCHEMA_ID, "{not json")
+
+    assert not result.is_valid
+    assert result.errors[0].startswith("Invalid JSON")
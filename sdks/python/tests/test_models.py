@@ -0,0 +1,29 @@
+"""
+Tests for the Pydantic response models.
+"""
+
+from helpers import schema_body
+from schema_registry.models import GetSchemaResponse, SchemaMetadata
+
+
+def test_trusted_empty_metadata_is_not_shared():
+    first = GetSchemaResponse.from_trusted(schema_body(metadata={}))
+    second = GetSchemaResponse.from_trusted(schema_body(metadata={}))
+
+    first.metadata.custom["x"] = 1
+
+    assert isinstance(second.metadata, SchemaMetadata)
+    assert second.metadata.custom == {}
+
+
+def trusted_with_tag(tag):
+    return GetSchemaResponse.from_trusted(schema_body(metadata={"tags": [tag]}))
+
+
+def test_trusted_metadata_interns_tags():
+    # Built at runtime, so the two tag strings start out as distinct objects
+    first = trusted_with_tag("".join(["l", "lm"]))
+    second = trusted_with_tag("".join(["l", "lm"]))
+
+    assert first.metadata.tags == ("llm",)
+    assert first.metadata.tags[0] is second.metadata.tags[0]
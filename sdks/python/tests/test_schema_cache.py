@@ -0,0 +1,85 @@
+"""
+Tests for the schema cache and the negative cache for missing schemas.
+"""
+
+import pytest
+
+from helpers import SCHEMA_ID, TIMESTAMP, schema_body
+from schema_registry import Schema, SchemaFormat, SchemaNotFoundError
+
+
+@pytest.fixture
+def schema_route(registry):
+    return registry.get(f"/api/v1/schemas/{SCHEMA_ID}").respond(json=schema_body())
+
+
+@pytest.fixture
+def missing_route(registry):
+    return registry.get(f"/api/v1/schemas/{SCHEMA_ID}").respond(
+        404, json={"message": "Schema does not exist"}
+    )
+
+
+async def test_mixed_case_ids_share_one_entry(client, schema_route):
+    first = await client.get_schema(SCHEMA_ID.upper())
+    second = await client.get_schema(SCHEMA_ID)
+
+    assert first is second
+    assert schema_route.call_count == 1
+
+
+async def test_use_cache_false_bypasses_the_cache(client, schema_route):
+    await client.get_schema(SCHEMA_ID)
+    await client.get_schema(SCHEMA_ID, use_cache=False)
+
+    assert schema_route.call_count == 2
+
+
+async def test_not_found_is_cached(client, missing_route):
+    with pytest.raises(SchemaNotFoundError) as fetched:
+        await client.get_schema(SCHEMA_ID)
+    with pytest.raises(SchemaNotFoundError) as cached:
+        await client.get_schema(SCHEMA_ID.upper())
+
+    assert missing_route.call_count == 1
+    assert fetched.value.schema_id == cached.value.schema_id == SCHEMA_ID
+
+
+async def test_use_cache_false_bypasses_the_negative_cache(client, missing_route):
+    with pytest.raises(SchemaNotFoundError):
+        await client.get_schema(SCHEMA_ID)
+    with pytest.raises(SchemaNotFoundError):
+        await client.get_schema(SCHEMA_ID, use_cache=False)
+
+    assert missing_route.call_count == 2
+
+
+async def test_register_schema_clears_the_negative_cache(client, registry, missing_route):
+    with pytest.raises(SchemaNotFoundError):
+        await client.get_schema(SCHEMA_ID)
+
+    registry.post("/api/v1/schemas").respond(
+        201, json={"schema_id": SCHEMA_ID, "version": "1.0.0", "created_at": TIMESTAMP}
+    )
+    await client.register_schema(
+        Schema(
+            namespace="telemetry",
+            name="InferenceEvent",
+            version="1.0.0",
+            format=SchemaFormat.JSON_SCHEMA,
+            content='{"type": "object"}',
+        )
+    )
+    missing_route.respond(json=schema_body())
+
+    result = await client.get_schema(SCHEMA_ID)
+
+    assert result.schema_id == SCHEMA_ID
+    assert missing_route.call_count == 2
+
+
+async def test_malformed_id_fails_without_a_request(client, schema_route):
+    with pytest.raises(SchemaNotFoundError):
+        await client.get_schema("not-a-uuid")
+
+    assert schema_route.call_count == 0
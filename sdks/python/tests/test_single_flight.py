@@ -0,0 +1,63 @@
+"""
+Tests for sharing in-flight get_schema requests.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from helpers import SCHEMA_ID, schema_body
+
+
+@pytest.fixture
+def release():
+    return asyncio.Event()
+
+
+@pytest.fixture
+def schema_route(registry, release):
+    async def respond(request):
+        await release.wait()
+        return httpx.Response(200, json=schema_body())
+
+    return registry.get(f"/api/v1/schemas/{SCHEMA_ID}").mock(side_effect=respond)
+
+
+async def test_concurrent_calls_share_one_request(client, schema_route, release):
+    calls = [asyncio.create_task(client.get_schema(SCHEMA_ID)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    release.set()
+
+    results = await asyncio.gather(*calls)
+
+    assert all(r.schema_id == SCHEMA_ID for r in results)
+    assert schema_route.call_count == 1
+    assert not client._inflight
+
+
+@pytest.mark.parametrize("cancelled", [0, 1])
+async def test_cancelling_one_caller_leaves_the_others(client, schema_route, release, cancelled):
+    calls = [asyncio.create_task(client.get_schema(SCHEMA_ID)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+
+    calls[cancelled].cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    result = await calls[1 - cancelled]
+    assert result.schema_id == SCHEMA_ID
+    with pytest.raises(asyncio.CancelledError):
+        await calls[cancelled]
+    assert schema_route.call_count == 1
+
+
+async def test_errors_reach_every_caller(client, registry):
+    registry.get(f"/api/v1/schemas/{SCHEMA_ID}").respond(400, json={"message": "bad request"})
+
+    results = await asyncio.gather(
+        client.get_schema(SCHEMA_ID), client.get_schema(SCHEMA_ID), return_exceptions=True
+    )
+
+    assert all(getattr(r, "status_code", None) == 400 for r in results)
+    assert not client._inflight